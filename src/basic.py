@@ -1,112 +1,85 @@
 from sympy import Basic, Symbol, true, false
+from functools import partial
+from dataclasses import dataclass
 from proposition import *
 from order_of_magnitude import *
 
 # Some code to handle sympy classes
 
+# `typeof` first determines the domain of an object and then the strongest sign condition it is known to satisfy; the name of the type is then read off from `_TYPE_LUT[domain][sign]`, with the last column used when no sign condition is known.  Complex numbers only admit the `nonzero` condition.
+
+_DOMAINS = ("is_integer", "is_rational", "is_real", "is_complex")
+_SIGNS = ("is_positive", "is_nonnegative", "is_nonzero")
+_TYPE_LUT = (
+    ("pos_int", "nonneg_int", "nonzero_int", "int"),
+    ("pos_rat", "nonneg_rat", "nonzero_rat", "rat"),
+    ("pos_real", "nonneg_real", "nonzero_real", "real"),
+    (None, None, "nonzero_complex", "complex"),
+)
+
 def typeof(obj:Basic) -> str:
     """
     Return a string describing the type of the object.  This is used to determine the type of a variable in a declaration.
     TODO: implement a more sophisticated type system that can also infer properties from ambient hypotheses.
     """
-    if obj.is_integer:
-        if obj.is_positive:
-            return f"pos_int"
-        elif obj.is_nonnegative:
-            return f"nonneg_int"
-        elif obj.is_nonzero:
-            return f"nonzero_int"
-        else:
-            return f"int"
-    elif obj.is_rational:
-        if obj.is_positive:
-            return f"pos_rat"
-        elif obj.is_nonnegative:
-            return f"nonneg_rat"
-        elif obj.is_nonzero:
-            return f"nonzero_rat"
-        else:
-            return f"rat"
-    elif obj.is_real:
-        if obj.is_positive:
-            return f"pos_real"
-        elif obj.is_nonnegative:
-            return f"nonneg_real"
-        elif obj.is_nonzero:
-            return f"nonzero_real"
-        else:
-            return f"real"
-    elif obj.is_complex"
-        if obj.is_nonzero:
-            return f"nonzero_complex"
-        return f"complex"
-    elif obj.is_Boolean:
-        return f"bool"
-    elif isinstance(obj, OrderSymbol):
-        return f"order"
-    else:
-        return f"unknown"
+    # cheap checks first, so that these objects never reach the assumption system
+    if isinstance(obj, OrderSymbol):
+        return "order"
+    if obj.is_Boolean:
+        return "bool"
+    for domain, names in zip(_DOMAINS, _TYPE_LUT):
+        if getattr(obj, domain):
+            for sign, name in zip(_SIGNS, names):
+                if name is not None and getattr(obj, sign):
+                    return name
+            return names[-1]
+    return "unknown"
+
+def _build_var_factory() -> dict:
+    """Build the table of variable constructors used by `new_var`, from the same tables that `typeof` uses so that the two always agree."""
+    factory = {}
+    for domain, names in zip(_DOMAINS, _TYPE_LUT):
+        for sign, name in zip(_SIGNS + (None,), names):
+            if name is None:
+                continue
+            assumptions = {domain.removeprefix("is_"): True}
+            if sign is not None:
+                assumptions[sign.removeprefix("is_")] = True
+            factory[name] = partial(Symbol, **assumptions)
+    factory["bool"] = Proposition
+    factory["order"] = OrderSymbol
+    return factory
+
+_VAR_FACTORY = _build_var_factory()
 
 def new_var(type:str, name:str) -> Expr:    
     """
     Create a new symbolic variable of the given type and name.
     """
-
-    match type:
-        case "int":
-            return Symbol(name, integer=True)
-        case "pos_int":
-            return Symbol(name, integer=True, positive=True)
-        case "nonneg_int":
-            return Symbol(name, integer=True, nonnegative=True)  
-        case "nonzero_int":
-            return Symbol(name, integer=True, nonzero=True)
-        case "real":
-            return Symbol(name, real=True)
-        case "pos_real":
-            return Symbol(name, real=True, positive=True)
-        case "nonneg_real":
-            return Symbol(name, real=True, nonnegative=True)
-        case "nonzero_real":
-            return Symbol(name, real=True, nonzero=True)
-        case "rat":
-            return Symbol(name, rational=True)
-        case "pos_rat":
-            return Symbol(name, rational=True, positive=True)
-        case "nonneg_rat":
-            return Symbol(name, rational=True, nonnegative=True)
-        case "nonzero_rat":
-            return Symbol(name, rational=True, nonzero=True)
-        case "complex":
-            return Symbol(name, complex=True)
-        case "nonzero_complex":
-            return Symbol(name, complex=True, nonzero=True)
-        case "bool":
-            return Proposition(name)
-        case "order":
-            return OrderSymbol(name)
-        case _:
-            raise ValueError(f"Unknown type {type}.  Currently accepted types: 'int', 'pos_int', 'nonneg_int', `nonzero_int`, 'real', 'pos_real', 'nonneg_real', 'nonzero_real', 'rat', 'pos_rat`, 'nonneg_rat', 'nonzero_rat', 'complex', 'nonzero_complex', 'bool', 'order'.")
+    try:
+        factory = _VAR_FACTORY[type]
+    except KeyError:
+        accepted = ", ".join(f"'{t}'" for t in _VAR_FACTORY)
+        raise ValueError(f"Unknown type {type}.  Currently accepted types: {accepted}.") from None
+    return factory(name)
 
 
-class Type(Basic):
+@dataclass(frozen=True, slots=True)
+class Type:
     """
-    A bare‐bones SymPy object to capture the "type" of of other SymPy expressions.  Used here to encode variable declarations: "x : int", for instance, is encoded as "x : Type(Symbol("x", integer=True))".
+    A bare‐bones object to capture the "type" of of other SymPy expressions.  Used here to encode variable declarations: "x : int", for instance, is encoded as "x : Type(Symbol("x", integer=True))".  This only wraps a single symbol, so it does not need to be a SymPy `Basic` (and pay for sympification and SymPy's caching on construction).
     """
-    def __new__(cls, *args):
-        assert len(args) == 1, "Type requires exactly one argument."
-        # force args into a tuple and pass to Basic
-        return Basic.__new__(cls, *args)
+    var_: Basic
 
     def var(self) -> Basic:
         """Return the variable that this type wraps around."""
-        return self.args[0]
+        return self.var_
 
     def __str__(self):
         return str(typeof(self.var()))
         
     def __repr__(self):
-        return f"Type({self.args})"
+        return f"Type({(self.var_,)})"
 
 def describe( name:str, object:Basic ) -> str:
     """Return a string description of a named sympy object."""
@@ -114,16 +87,19 @@ def describe( name:str, object:Basic ) -> str:
 
 def is_defined(expr:Expr, vars:set[Expr]) -> bool:
     """Check if expr is defined in terms of the set `vars` of other expressions"""
-    expr = S(expr)
-    if expr in vars:
-        return True
-    if expr.is_number:
-        return True
-    if expr == true or expr == false:
-        return True
-    if len(expr.args) == 0:
-        return False
-    for arg in expr.args:
-        if not is_defined(arg, vars):
+    if not isinstance(vars, (set, frozenset)):
+        vars = frozenset(vars)
+    # walk the expression tree with an explicit stack, visiting each shared subexpression only once
+    stack = [S(expr)]
+    seen = set()
+    while stack:
+        expr = stack.pop()
+        if id(expr) in seen:
+            continue
+        seen.add(id(expr))
+        if expr in vars or expr.is_number or expr == true or expr == false:
+            continue
+        if len(expr.args) == 0:
             return False
+        stack.extend(expr.args)
     return True
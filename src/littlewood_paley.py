@@ -2,17 +2,20 @@ from sympy.logic.boolalg import BooleanFunction
 from order_of_magnitude import *
 from sympy.core.expr import Expr
 from fractions import Fraction
+from functools import cached_property
 
 # Support for some expressions that come up in the Littlewood-Paley theory arising in PDE
 
+_HALF = Fraction(1,2)
+
 def sqrt(x):
-    return x**Fraction(1,2)
+    return x**_HALF
 
 def bracket(x):
     """
     The "Japanese bracket" notation.
     """
-    return sqrt(1 + abs(x)**2)
+    return (1 + abs(x)**2)**_HALF
 
 
 class LittlewoodPaley(BooleanFunction):
@@ -25,9 +28,11 @@ class LittlewoodPaley(BooleanFunction):
         if len(args) == 2:  # LP collapses to asymptotic equivalence when there are just two arguments
             return asymp(args[0], args[1])
         newargs = [Theta(x) for x in args]
-        obj = Expr.__new__(cls, *newargs)
-        obj.name = "LittlewoodPaley(" + ", ".join([str(arg) for arg in newargs]) + ")"
-        return obj
+        return Expr.__new__(cls, *newargs)
+
+    @cached_property
+    def name(self):
+        return "LittlewoodPaley(" + ", ".join([str(arg) for arg in self.args]) + ")"
 
     def __str__(self):
         return self.name
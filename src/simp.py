@@ -76,8 +76,8 @@ def simp(goal: Basic, hyp: Basic) -> Basic:
     if test({hyp}, Not(new_goal)):
         return false
     
-    if hyp.is_Boolean:
-        # If the hypothesis is a boolean, we can use it to simplify the goal further.
+    if not isinstance(hyp, Type) and hyp.is_Boolean:
+        # If the hypothesis is a boolean (rather than a variable declaration), we can use it to simplify the goal further.
         new_goal = simplify(new_goal.subs(hyp, True))
 
         if isinstance(hyp, Not):
@@ -161,7 +161,7 @@ class IsPositive(Tactic):
         for other_name, other_var in state.hypotheses.items():
             if other_name == name:
                 newstate.hypotheses[name] = Type(newvar)
-            else:
+            elif not isinstance(other_var, Type):  # other variable declarations are unaffected
                 newstate.hypotheses[other_name] = other_var.subs(var, newvar)
         newstate.set_goal(state.goal.subs(var, newvar))
 
@@ -211,7 +211,7 @@ class IsNonnegative(Tactic):
         for other_name, other_var in state.hypotheses.items():
             if other_name == name:
                 newstate.hypotheses[name] = Type(newvar)
-            else:
+            elif not isinstance(other_var, Type):  # other variable declarations are unaffected
                 newstate.hypotheses[other_name] = other_var.subs(var, newvar)
         newstate.set_goal(newstate.goal.subs(var, newvar))
 
@@ -262,7 +262,7 @@ class IsNonzero(Tactic):
         for other_name, other_var in state.hypotheses.items():
             if other_name == name:
                 newstate.hypotheses[name] = Type(newvar)
-            else:
+            elif not isinstance(other_var, Type):  # other variable declarations are unaffected
                 newstate.hypotheses[other_name] = other_var.subs(var, newvar)
         newstate.set_goal(newstate.goal.subs(var, newvar))
 
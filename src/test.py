@@ -14,6 +14,8 @@ def test(hypotheses: set[Basic], goal: Basic) -> bool:
         return True
     
     for hyp in hypotheses:
+        if isinstance(hyp, Type):
+            continue  # variable declarations are not logical statements
         if Implies(hyp, goal) == True:
             print(f"Goal {goal} follows from hypothesis {hyp}!")
             return True
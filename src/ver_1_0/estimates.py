@@ -1,6 +1,7 @@
 from statements import *
 from expressions import *
 import itertools
+from functools import cached_property
 
 
 # An estimate is a comparison between two expressions that is of one of the following forms:
@@ -11,13 +12,22 @@ import itertools
 ## X >~ Y:  Y = O(X)
 ## X >> Y:  Y = o(X)
 
+# The negation of each operator; None marks "~", whose negation is a disjunction.
+_NEGATE = {"<~": ">>", "<<": ">~", "~": None, ">~": "<<", ">>": "<~"}
+
+# The \leq type operators, and their \geq type reversals
+_REVERSE = {"<~": ">~", "<<": ">>"}
+
 class Estimate(Statement):
     def __init__(self, left, operator, right):
         self.left = ensure_expr(left)
         self.right = ensure_expr(right)
-        assert operator in ("<~", "<<", "~", ">~", ">>"), f"Invalid operator {operator} for Estimate."
+        assert operator in _NEGATE, f"Invalid operator {operator} for Estimate."
         self.operator = operator 
-        self.name = f"{self.left} {self.operator} {self.right}"
+
+    @cached_property
+    def name(self):
+        return f"{self.left} {self.operator} {self.right}"
         
     def defeq(self, other):
         if isinstance(other, Estimate):
@@ -27,59 +37,52 @@ class Estimate(Statement):
         return False
 
     def negate(self):
-        match self.operator:
-            case "<~":
-                return Estimate(self.left,  ">>", self.right)
-            case "<<":
-                return Estimate(self.left, ">~", self.right)
-            case "~":
-                return Or( Estimate(self.left, ">>", self.right), Estimate(self.left, "<<", self.right) )
-            case ">~":
-                return Estimate(self.left, "<<", self.right)
-            case ">>":
-                return Estimate(self.left, "<~", self.right)
-            case _:
-                raise ValueError(f"Unknown operator {self.operator} in negate() method of Estimate.")
+        operator = _NEGATE[self.operator]
+        if operator is None:
+            return Or( Estimate(self.left, ">>", self.right), Estimate(self.left, "<<", self.right) )
+        return Estimate(self.left, operator, self.right)
             
     def simp(self, hypotheses=set()):
         # Reverse \leq type inequalities to \geq to reach simp normal form
-        if self.operator == "<~":  
-            return Estimate(self.right, ">~", self.left).simp(hypotheses)
-        if self.operator == "<<":  
-            return Estimate(self.right, ">>", self.left).simp(hypotheses)
+        if self.operator in _REVERSE:
+            return Estimate(self.right, _REVERSE[self.operator], self.left).simp(hypotheses)
+
+        # an expression is comparable to itself, but not much larger than itself
+        if self.left.defeq(self.right):
+            return TRUE if self.operator in (">~", "~") else FALSE
 
         # normalize RHS to 1 to reach simp normal form
         left = (self.left/self.right).simp(hypotheses)
-        right = Constant(1)
+        right = ONE
     
         if left.defeq(right):
-            return Bool(self.operator in ("<~", ">~", "~"))
+            return TRUE if self.operator in (">~", "~") else FALSE
     
         return Estimate(left, self.operator, right)
     
 
 def expression_le(self, other):
-    return Estimate(self, '<~', ensure_expr(other))
+    return Estimate(self, '<~', other)
 Expression.__le__ = expression_le
 Expression.lesssim = expression_le  # alias for <~
 
 def expression_lt(self, other):
-    return Estimate(self, '<<', ensure_expr(other))
+    return Estimate(self, '<<', other)
 Expression.__lt__ = expression_lt
 Expression.ll = expression_lt  # alias for <<
 
 def expression_ge(self, other):
-    return Estimate(self, '>~', ensure_expr(other))
+    return Estimate(self, '>~', other)
 Expression.__ge__ = expression_ge
 Expression.gtrsim = expression_ge  # alias for >~
 
 def expression_gt(self, other):
-    return Estimate(self, '>>', ensure_expr(other))
+    return Estimate(self, '>>', other)
 Expression.__gt__ = expression_gt
 Expression.gg = expression_gt  # alias for >>
 
 def expression_eq(self, other):
-    return Estimate(self, '~', ensure_expr(other))
+    return Estimate(self, '~', other)
 Expression.asymp = expression_eq  # cannot override __eq__ because it is used for object identity, not equality of expressions
     
 # the Littlewood-Paley property asserts that some collection N_1,...,N_k of variables are magnitudes (up to constants) of vectors that sum to zero.  Equivalently, two of them are comparable in magnitude and bound the rest.
@@ -87,11 +90,12 @@ Expression.asymp = expression_eq  # cannot override __eq__ because it is used fo
 def LP_property(*args):
     cases = []
     assert len(args) > 1, "Error: Littlewood-Paley constraints must involve at least two variables."
-    for expr1, expr2 in itertools.combinations(args, 2):
-        conjuncts = { expr1.asymp(expr2) }
-        for other_expr in args:
-            if not other_expr.defeq(expr1) and not other_expr.defeq(expr2):
-                conjuncts.add(other_expr <= expr1)
+    n = len(args)
+    # build each bound args[k] <~ args[i] once, so that it is shared between all the cases that use it; i only ranges up to n-2, as i < j in each case
+    le = [[args[k] <= args[i] if k != i else None for i in range(n - 1)] for k in range(n)]
+    for i, j in itertools.combinations(range(n), 2):
+        conjuncts = [args[i].asymp(args[j])]
+        conjuncts.extend(le[k][i] for k in range(n) if k != i and k != j)
         cases.append(And(*conjuncts))
     return Or(*cases)
 
@@ -1,40 +1,82 @@
 from type import *
 from fractions import Fraction
+from itertools import chain, count
+from operator import attrgetter
+from weakref import WeakValueDictionary
+
+# The result of simp() is memoized on each node, in its _simp_result slot.  The hypotheses are not part of the key: no expression simplification reads them (they are only passed down to the operands), so the result depends on the node alone.  Each simp() method reads and writes the memo inline through the two helpers below, rather than through a decorator, so that simplifying a deeply nested expression does not push an extra frame per level.
+
+_SIMP_IS_SELF = object()  # stands for an expression that is already simplified, to avoid a reference cycle
+
+def _simp_memo(expr):
+    """Return the memoized simplification of expr, or None if it has not been simplified yet."""
+    result = getattr(expr, '_simp_result', None)
+    return expr if result is _SIMP_IS_SELF else result
+
+def _simp_memoize(expr, result):
+    """Memoize result as the simplification of expr, and return it."""
+    expr._simp_result = _SIMP_IS_SELF if result is expr else result
+    return result
+
+# Composite expressions are hash-consed: constructing an expression that is structurally equal to a live one returns the existing object, so that defeq reduces to identity.  The table is keyed on (class, ids of the children, payload) and holds its entries weakly, so an expression is dropped from it as soon as it is no longer used.  Using ids is safe because the children of a live entry are kept alive by it, so their ids cannot be reused while the entry exists.
+_INTERN = WeakValueDictionary()
+
+def _ordered_ids(operands):
+    return tuple(map(id, operands))
+
+# The operands of commutative operations are stored in a canonical order, so that how an expression prints does not depend on which equal expressions happen to be alive.  Every expression has an `_order`: constants come first, by value, then variables, in order of creation, then composite expressions, by class and then by the orders of their operands.  Distinct expressions never have equal orders, so sorting by order also makes the ids of the operands a canonical key.
+_order_of = attrgetter('_order')
+
+def _sorted_operands(operands):
+    return tuple(sorted(operands, key=_order_of))
+
+def _composite_order(cls, operands, payload=None):
+    return (cls._rank, tuple(map(_order_of, operands)), payload)
+
+_VARIABLE_SERIALS = count()
+
+def _new_interned(cls, key):
+    """Create an instance of cls and register it in the intern table under `key`.  The caller fills in the attributes."""
+    obj = object.__new__(cls)
+    _INTERN[key] = obj
+    return obj
+
+# How to turn an object of a given (exact) type into an Expression.  Every subclass of Expression registers itself here when it is defined.
+
+def _same_expr(obj):
+    return obj
+
+def _to_expr_fallback(obj):
+    """Used for types not in _TO_EXPR, e.g. subclasses of int."""
+    return obj if isinstance(obj, Expression) else Constant(obj)
+
+_TO_EXPR = {}  # ints and floats are added once Constant is defined
 
 class Expression(Type):
-    """A formal expression that represents an order of magnitude."""
+    """A formal expression that represents an order of magnitude.  Expressions are hash-consed, so two expressions are defeq exactly when they are the same object."""
+    __slots__ = ('operands', '_order', '_simp_result', '__weakref__')
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _TO_EXPR[cls] = _same_expr  # so that ensure_expr passes instances of cls through unchanged
+    def __copy__(self):
+        """Expressions are immutable and interned, so a copy must be the expression itself; copying the slots would bypass the intern table."""
+        return self
+    def __deepcopy__(self, memo):
+        return self
     def add(self, other):
         """Automatically flatten sums."""
-        summands = []
-        if isinstance(self, Add):
-            for summand in self.summands:
-                summands.append(summand)
-        else:
-            summands.append(self)
-        if isinstance(other, Add):
-            for summand in other.summands:
-                summands.append(summand)
-        else:
-            summands.append(other)
-        return Add(*summands)
+        a = self.summands if isinstance(self, Add) else (self,)
+        b = other.summands if isinstance(other, Add) else (other,)
+        return Add._from_iter(chain(a, b))
     def __add__(self, other):
         return self.add(ensure_expr(other))
     def __radd__(self, other):
         return ensure_expr(other).add(self)
     def mul(self, other):
         """Automatically flatten products."""
-        factors = []
-        if isinstance(self, Mul):
-            for factor in self.factors:
-                factors.append(factor)
-        else:
-            factors.append(self)
-        if isinstance(other, Mul):
-            for factor in other.factors:
-                factors.append(factor)
-        else:
-            factors.append(other)
-        return Mul(*factors)
+        a = self.factors if isinstance(self, Mul) else (self,)
+        b = other.factors if isinstance(other, Mul) else (other,)
+        return Mul._from_iter(chain(a, b))
     def __pow__(self, other):
         return Power(self, other)
     def __mul__(self, other):
@@ -42,65 +84,88 @@ class Expression(Type):
     def __rmul__(self, other):
         return ensure_expr(other).mul(self)
     def __truediv__(self, other):
-        return Div(self, ensure_expr(other))
+        return Div(self, other)  # Div coerces its arguments itself
     def __rtruediv__(self, other):
-        return Div(ensure_expr(other), self)
-
-
+        return Div(other, self)
 
 def ensure_expr(obj):
     """If obj is already an Expression, return it;
        otherwise wrap it in a Constant."""
-    return obj if isinstance(obj, Expression) else Constant(obj)
+    return _TO_EXPR.get(type(obj), _to_expr_fallback)(obj)
 
 class Variable(Expression):
     """A variable magnitude."""
+    __slots__ = ('name',)
+    _rank = 1
     def __init__(self, name):
         self.name = name
-        self.operands = []
+        self.operands = ()  # variables are only defeq to themselves, even if they share a name
+        self._order = (Variable._rank, next(_VARIABLE_SERIALS))
 
+# Constants are interned in the same weak table, so that e.g. every live Constant(2) is the same object.  Keyed on the value alone, so that Constant(2) and Constant(2.0), which are definitionally equal, are also the same object; whichever is built first decides how it is printed.
 class Constant(Expression):
     """A constant magnitude."""
-    def __init__(self, value):
-        assert isinstance(value, (int, float)), "Constant value must be an int or float."
-        assert value > 0, "Constant value must be positive."
-        self.value = value
-        self.operands = []
-    def defeq(self, other):
-        """Check if two constants are definitionally equal (i.e., have the same value)."""
-        if isinstance(other, Constant):
-            return self.value == other.value
-        return False
+    __slots__ = ('value',)
+    _rank = 0
+    def __new__(cls, value):
+        key = (Constant, value)
+        obj = _INTERN.get(key)
+        if obj is None:
+            assert isinstance(value, (int, float)), "Constant value must be an int or float."
+            assert value > 0, "Constant value must be positive."
+            obj = _new_interned(cls, key)
+            obj.value = value
+            obj.operands = ()
+            obj._order = (Constant._rank, value)
+        return obj
     def simp(self, hypotheses=()):
         """Because we are working with orders of magnitude, constants can be simplified to 1."""
-        return Constant(1)
+        return ONE
     def __str__(self):
         return str(self.value)
 
+ONE = Constant(1)  # kept alive by this reference, unlike other constants
+_TO_EXPR[int] = _TO_EXPR[float] = Constant
+
+def _max_or_min_of(cls, operands):
+    """Combine operands that are already simplified into cls(*operands), where cls is Max or Min: flatten nested cls expressions and remove duplicates (up to defeq, i.e. by identity) while keeping the first occurrence of each.  The caller simplifies the operands itself, so that this function is not on the stack while they are simplified."""
+    flat = []
+    for op in operands:
+        flat.extend(op.operands if isinstance(op, cls) else (op,))
+    seen = set()
+    new_operands = []
+    for op in flat:
+        if id(op) not in seen:
+            seen.add(id(op))
+            new_operands.append(op)
+    assert len(new_operands) > 0, f"{cls.__name__} must have at least one operand after simplification."
+    if len(new_operands) == 1:
+        return new_operands[0]
+    return cls(*new_operands)
+
 class Max(Expression):
     """The formal maximum of a set of expressions."""
-    def __init__(self, *operands):
+    __slots__ = ()
+    _rank = 6
+    def __new__(cls, *operands):
         assert len(operands) > 0, "Max must have at least one operand."
-        self.operands = [ensure_expr(operand) for operand in operands]
-    def defeq(self, other):
-        if isinstance(other, Max):
-            return set_defeq(self.operands, other.operands)
-        return False
+        operands = _sorted_operands(ensure_expr(operand) for operand in operands)
+        key = (Max, _ordered_ids(operands))
+        obj = _INTERN.get(key)
+        if obj is None:
+            obj = _new_interned(cls, key)
+            obj.operands = operands
+            obj._order = _composite_order(cls, operands)
+        return obj
     def simp(self, hypotheses=()):
         """Simplify the max expression by flattening nested max's and removing duplicates."""
-        new_operands = set()
+        result = _simp_memo(self)
+        if result is not None:
+            return result
+        operands = []
         for op in self.operands:
-            op = op.simp(hypotheses)
-            if isinstance(op, Max):
-                for sub_op in op.operands:
-                    sub_op.add_to(new_operands)
-            else:
-                op.add_to(new_operands)
-        assert len(new_operands) > 0, "Max must have at least one operand after simplification."
-        if len(new_operands) == 1:
-            return new_operands.pop()
-        else:
-            return Max(*new_operands)
+            operands.append(op.simp(hypotheses))
+        return _simp_memoize(self, _max_or_min_of(Max, operands))
     def __str__(self):
         inner = ", ".join(str(op) for op in self.operands)
         return f"max({inner})"
@@ -111,28 +176,27 @@ def max(*args):
 
 class Min(Expression):
     """The formal minimum of a set of expressions."""
-    def __init__(self, *operands):
+    __slots__ = ()
+    _rank = 7
+    def __new__(cls, *operands):
         assert len(operands) > 0, "Min must have at least one operand."
-        self.operands = [ensure_expr(operand) for operand in operands]
-    def defeq(self, other):
-        if isinstance(other, Min):
-            return set_defeq(self.operands, other.operands)
-        return False
+        operands = _sorted_operands(ensure_expr(operand) for operand in operands)
+        key = (Min, _ordered_ids(operands))
+        obj = _INTERN.get(key)
+        if obj is None:
+            obj = _new_interned(cls, key)
+            obj.operands = operands
+            obj._order = _composite_order(cls, operands)
+        return obj
     def simp(self, hypotheses=()):
         """Simplify the min expression by flattening nested mins and removing duplicates."""
-        new_operands = set()
+        result = _simp_memo(self)
+        if result is not None:
+            return result
+        operands = []
         for op in self.operands:
-            op = op.simp(hypotheses)
-            if isinstance(op, Min):
-                for sub_op in op.operands:
-                    sub_op.add_to(new_operands)
-            else:
-                op.add_to(new_operands)
-        assert len(new_operands) > 0, "Min must have at least one operand after simplification."
-        if len(new_operands) == 1:
-            return new_operands.pop()
-        else:
-            return Min(*new_operands)
+            operands.append(op.simp(hypotheses))
+        return _simp_memoize(self, _max_or_min_of(Min, operands))
     def __str__(self):
         inner = ", ".join(str(op) for op in self.operands)
         return f"min({inner})"
@@ -142,37 +206,69 @@ def min(*args):
 
 class Add(Expression):
     """The formal sum of a set of expressions."""
-    def __init__(self, *summands):
+    __slots__ = ('summands',)
+    _rank = 2
+    def __new__(cls, *summands):
+        return cls._from_iter(ensure_expr(summand) for summand in summands)
+    @classmethod
+    def _from_iter(cls, summands):
+        """Build a sum from an iterable of summands, which must already be Expressions."""
+        summands = _sorted_operands(summands)
         assert len(summands) > 0, "Add must have at least one summand."
-        self.summands = [ensure_expr(summand) for summand in summands]
-        self.operands = self.summands  
-    def defeq(self, other):
-        if isinstance(other, Add):
-            return set_defeq(self.summands, other.summands)
-        return False
+        key = (Add, _ordered_ids(summands))
+        obj = _INTERN.get(key)
+        if obj is None:
+            obj = _new_interned(cls, key)
+            obj.summands = summands
+            obj.operands = summands
+            obj._order = _composite_order(cls, summands)
+        return obj
     def simp(self, hypotheses=()):
         """For orders of magnitude, one can turn a sum into a max."""
-        return Max(*self.summands).simp(hypotheses)
+        result = _simp_memo(self)
+        if result is not None:
+            return result
+        operands = []
+        for op in self.summands:
+            operands.append(op.simp(hypotheses))
+        return _simp_memoize(self, _max_or_min_of(Max, operands))
     def __str__(self):
         inner = " + ".join(str(sm) for sm in self.summands)
         return f"({inner})"
 
 class Mul(Expression):
     """The formal product of a set of expressions."""
-    def __init__(self, *factors):
-        self.factors = [ensure_expr(factor) for factor in factors]
-        self.operands = self.factors  
-    def defeq(self, other):
-        if isinstance(other, Mul):
-            return set_defeq(self.factors, other.factors)
-        return False
+    __slots__ = ('factors',)
+    _rank = 3
+    def __new__(cls, *factors):
+        return cls._from_iter(ensure_expr(factor) for factor in factors)
+    @classmethod
+    def _from_iter(cls, factors):
+        """Build a product from an iterable of factors, which must already be Expressions."""
+        factors = _sorted_operands(factors)
+        key = (Mul, _ordered_ids(factors))
+        obj = _INTERN.get(key)
+        if obj is None:
+            obj = _new_interned(cls, key)
+            obj.factors = factors
+            obj.operands = factors
+            obj._order = _composite_order(cls, factors)
+        return obj
     def simp(self, hypotheses=()):
-        """Simplify the product in several steps."""
+        result = _simp_memo(self)
+        if result is not None:
+            return result
+        factors = []
+        for factor in self.factors:
+            factors.append(factor.simp(hypotheses))
+        return _simp_memoize(self, Mul._simp_factors(factors, hypotheses))
+    @staticmethod
+    def _simp_factors(factors, hypotheses=()):
+        """Simplify the product of the given factors, which must already be simplified themselves, in several steps.  The caller simplifies the factors, so that this function is not on the stack while they are simplified."""
         
         # First, flatten nested products and delete constants.
         new_factors = []
-        for factor in self.factors:
-            factor = factor.simp(hypotheses)
+        for factor in factors:
             if isinstance(factor, Mul):
                 for sub_factor in factor.factors:
                     new_factors.append(sub_factor)
@@ -181,7 +277,7 @@ class Mul(Expression):
             else:
                 new_factors.append(factor)
 
-        # Next, gather terms (up to defeq) and combine exponents for powers.
+        # Next, gather terms (up to defeq, i.e. by identity) and combine exponents for powers.
         terms = {}
         for factor in new_factors:
             if isinstance(factor, Power):
@@ -190,23 +286,22 @@ class Mul(Expression):
             else:
                 base = factor
                 exponent = Fraction(1, 1)
-            new = True
-            for b in terms:
-                if base.defeq(b):
-                    terms[b] += exponent
-                    new = False
-                    break
-            if new:
-                terms[base] = exponent        
+            key = id(base)
+            if key in terms:
+                terms[key][1] += exponent
+            else:
+                terms[key] = [base, exponent]
 
         # Simplify all monomials and remove constants
         final_factors = []
-        for base, exponent in terms.items():
+        for base, exponent in terms.values():
             monomial = Power(base,exponent).simp(hypotheses)
             if not isinstance(monomial,Constant):
                 final_factors.append(monomial)
 
-        return Mul(*final_factors)
+        if len(final_factors) == 0:
+            return ONE
+        return Mul._from_iter(final_factors)
 
     def __str__(self):
         inner = " * ".join(str(f) for f in self.factors)
@@ -214,57 +309,82 @@ class Mul(Expression):
 
 class Div(Expression):
     """The formal quotient of two expressions."""
-    def __init__(self, numerator, denominator):
-        self.numerator = ensure_expr(numerator)
-        self.denominator = ensure_expr(denominator)
-        self.operands = [self.numerator, self.denominator]  
-    def defeq(self, other):
-        if isinstance(other, Div):
-            return self.numerator.defeq(other.numerator) and self.denominator.defeq(other.denominator)
-        return False
+    __slots__ = ('numerator', 'denominator')
+    _rank = 4
+    def __new__(cls, numerator, denominator):
+        numerator = ensure_expr(numerator)
+        denominator = ensure_expr(denominator)
+        key = (Div, _ordered_ids((numerator, denominator)))
+        obj = _INTERN.get(key)
+        if obj is None:
+            obj = _new_interned(cls, key)
+            obj.numerator = numerator
+            obj.denominator = denominator
+            obj.operands = (numerator, denominator)
+            obj._order = _composite_order(cls, obj.operands)
+        return obj
     def simp(self, hypotheses=()): 
-        # appeal to Mul's simplifier to handle division
-        return (self.numerator * (self.denominator**(-1))).simp(hypotheses)
+        result = _simp_memo(self)
+        if result is not None:
+            return result
+        # appeal to Mul's simplifier to handle division, without building the intermediate product
+        factors = (self.numerator.simp(hypotheses), Power(self.denominator, -1).simp(hypotheses))
+        return _simp_memoize(self, Mul._simp_factors(factors, hypotheses))
     def __str__(self):
         return f"({self.numerator} / {self.denominator})"
 
+# How to convert each accepted type of exponent to a Fraction
+_EXPONENT_CONVERSIONS = {
+    int: lambda e: Fraction(e, 1),
+    Fraction: lambda e: e,
+}
+
 class Power(Expression):
     """The formal power of an expression raised to an exponent.  To use exact arithmetic, exponents must be rational. """
-    def __init__(self, base, exponent):
-        self.base = ensure_expr(base)
-        self.operands = [self.base]  # For compatibility with Max/Min
-        if isinstance(exponent, int):
-            self.exponent = Fraction(exponent, 1)  # Convert integer exponent to Fraction
-        elif isinstance(exponent, Fraction):
-            self.exponent = exponent
-        else:
+    __slots__ = ('base', 'exponent')
+    _rank = 5
+    def __new__(cls, base, exponent):
+        base = ensure_expr(base)
+        to_fraction = _EXPONENT_CONVERSIONS.get(type(exponent))
+        if to_fraction is None:
             raise ValueError(f"Exponent {exponent} must be an int or rational, was type {type(exponent)}.")
-    def defeq(self, other):
-        if isinstance(other, Power):
-            return self.base.defeq(other.base) and self.exponent == other.exponent
-        return False
+        exponent = to_fraction(exponent)
+        key = (Power, id(base), exponent)
+        obj = _INTERN.get(key)
+        if obj is None:
+            obj = _new_interned(cls, key)
+            obj.base = base
+            obj.operands = (base,)  # For compatibility with Max/Min
+            obj.exponent = exponent
+            obj._order = _composite_order(cls, obj.operands, exponent)
+        return obj
     def simp(self, hypotheses=()):
+        result = _simp_memo(self)
+        if result is not None:
+            return result
         base = self.base.simp(hypotheses)
         if self.exponent == Fraction(1,1):
-            return base  # x^1 simplifies to x
+            return _simp_memoize(self, base)  # x^1 simplifies to x
         if self.exponent == Fraction(0,1) or isinstance(base, Constant):
-            return Constant(1)
+            return _simp_memoize(self, ONE)
         if isinstance(base, Power):
             # If the base is already a power, we can combine the exponents
-            return Power(base.base, base.exponent * self.exponent)
+            return _simp_memoize(self, Power(base.base, base.exponent * self.exponent))
         if isinstance(base, Mul):
             # distribute the exponent over the product
-            return Mul(*(Power(factor, self.exponent) for factor in base.factors)).simp(hypotheses)
-        return Power(base, self.exponent)
+            return _simp_memoize(self, Mul._from_iter(Power(factor, self.exponent) for factor in base.factors).simp(hypotheses))
+        return _simp_memoize(self, Power(base, self.exponent))
     def __str__(self):
         return f"({self.base} ^ {self.exponent})"
 
+_HALF = Fraction(1, 2)
+
 def sqrt(expr):
-    return Power(expr, Fraction(1, 2))
+    return Power(expr, _HALF)
 Expression.sqrt = sqrt  # Add a convenience method to Expression
 
 def bracket(expr):
     """ The "Japanese bracket" <x> = (1 + |x|^2)^{1/2} """
-    return sqrt(Add(Constant(1), Power(expr, 2)))
+    return Power(Add(ONE, Power(expr, 2)), _HALF)
 Expression.bracket = bracket  # Add a convenience method to Expression
 
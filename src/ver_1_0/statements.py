@@ -8,7 +8,7 @@ class Statement(Type):
     def simp(self, hypotheses=()):
         """Simplify the statement.  Can be overridden.  Can use the hypotheses in the `hypotheses` to simplify."""
         if self.appears_in(hypotheses):
-            return Bool(True)
+            return TRUE
         return self
 
 class Proposition(Statement):
@@ -29,7 +29,7 @@ class Or(Statement):
         return And(*(d.negate() for d in self.disjuncts))
     def simp(self, hypotheses=()):
         if self.appears_in(hypotheses):
-            return Bool(True)
+            return TRUE
         new_disjuncts = set()
         """Simplify the disjunction by flattening nested ORs and removing duplicates."""
         for disjunct in self.disjuncts:
@@ -39,11 +39,11 @@ class Or(Statement):
                     d.add_to(new_disjuncts)
             elif isinstance(disjunct, Bool):
                 if disjunct.bool_value:
-                    return Bool(True)  # True OR anything is True, while False OR anything is the other thing
+                    return TRUE  # True OR anything is True, while False OR anything is the other thing
             else:
                 disjunct.add_to(new_disjuncts)
         if len(new_disjuncts) == 0:
-            return Bool(False)
+            return FALSE
         elif len(new_disjuncts) == 1:
             return new_disjuncts.pop()
         else:
@@ -65,7 +65,7 @@ class And(Statement):
         return Or(*(c.negate() for c in self.conjuncts))
     def simp(self, hypotheses=()):
         if self.appears_in(hypotheses):
-            return Bool(True)
+            return TRUE
         new_conjuncts = set()
         """Simplify the conjunction by flattening nested ANDs and removing duplicates."""
         for conjunct in self.conjuncts:
@@ -75,11 +75,11 @@ class And(Statement):
                     c.add_to(new_conjuncts)
             elif isinstance(conjunct, Bool):
                 if not conjunct.bool_value:
-                    return Bool(False) # False AND anything is False, while True AND anything is the other thing
+                    return FALSE # False AND anything is False, while True AND anything is the other thing
             else:
                 conjunct.add_to(new_conjuncts)
         if len(new_conjuncts) == 0:
-            return Bool(True)
+            return TRUE
         elif len(new_conjuncts) == 1:
             return new_conjuncts.pop()
         else:
@@ -101,7 +101,7 @@ class Not(Statement):
         return self.operand
     def simp(self, hypotheses=()):
         if self.appears_in(hypotheses):
-            return Bool(True)
+            return TRUE
         return self.operand.simp(hypotheses).negate()
     def __str__(self):
         return f"NOT {self.operand}"
@@ -116,7 +116,9 @@ class Bool(Statement):
         return False
     def negate(self):
         """Negate the boolean value."""
-        return Bool(not self.bool_value)
+        return FALSE if self.bool_value else TRUE
     def __str__(self):
         return str(self.bool_value).upper()
 
+TRUE = Bool(True)
+FALSE = Bool(False)
@@ -1,6 +1,7 @@
 # A concept is a mathematical expression with a notion of definitional equality.  This is a way to check if two types are considered equal in the context of a proof or mathematical reasoning, even if they are not the same object in memory.
 # Concepts can be either mutable or immutable.  Generally speaking, one uses mutable concepts when manipulating the proof state (e.g., replacing a hypothesis with a simplified hypothesis), but uses immutable concepts in all other cases.
 class Concept:
+    __slots__ = ()  # so that subclasses can opt out of a per-instance __dict__
     def __hash__(self):
         """Return a hash of the concept.  This is used to allow concepts to be used in sets and as dictionary keys."""
         return id(self)    
@@ -67,6 +68,7 @@ def mutable(type):
 
 class Type(Concept):
     """A type is a statement, expression, or other first-class mathematical object."""
+    __slots__ = ()
     def __str__(self):
         return self.name
     def simp(self, hypotheses=set()):